@@ -1,23 +1,18 @@
-import shutil
-import tempfile
 from django.contrib.auth import get_user_model
-from django.conf import settings
-from django.test import Client, TestCase, override_settings
+from django.test import Client, TestCase
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Max
 
 from posts.models import Post, Group, Comment
+from posts.tests import SMALL_GIF, TempMediaRootMixin
 
 User = get_user_model()
 
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
 
-
-@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
-class PostCreateFormTests(TestCase):
+class PostCreateFormTests(TempMediaRootMixin, TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='Evgeny')
         cls.group = Group.objects.create(
             slug='test-slug',
@@ -29,31 +24,21 @@ class PostCreateFormTests(TestCase):
             author=cls.user,
             group=cls.group
         )
-
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
-
-    def setUp(self):
-        self.guest_client = Client()
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
+        cls.guest_client = Client()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
+        cls.url_create = reverse('posts:post_create')
+        cls.url_profile = reverse('posts:profile', args=[cls.user.username])
+        cls.url_edit = reverse('posts:post_edit', args=[cls.post.id])
+        cls.url_detail = reverse('posts:post_detail', args=[cls.post.id])
+        cls.url_comment = reverse('posts:add_comment', args=[cls.post.id])
 
     def test_create_post(self):
         """Валидная форма создает запись в Post."""
-        post_count = Post.objects.count()
-        small_gif = (
-            b'\x47\x49\x46\x38\x39\x61\x02\x00'
-            b'\x01\x00\x80\x00\x00\x00\x00\x00'
-            b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
-            b'\x00\x00\x00\x2C\x00\x00\x00\x00'
-            b'\x02\x00\x01\x00\x00\x02\x02\x0C'
-            b'\x0A\x00\x3B'
-        )
+        prev_max_id = Post.objects.aggregate(m=Max('id'))['m'] or 0
         uploaded = SimpleUploadedFile(
             name='small.gif',
-            content=small_gif,
+            content=SMALL_GIF,
             content_type='image/gif'
         )
         form_data = {
@@ -62,14 +47,15 @@ class PostCreateFormTests(TestCase):
             'image': uploaded,
         }
         response = self.authorized_client.post(
-            reverse('posts:post_create'),
-            data=form_data,
-            follow=True
+            self.url_create,
+            data=form_data
+        )
+        self.assertRedirects(
+            response,
+            self.url_profile,
+            fetch_redirect_response=False
         )
-        self.assertRedirects(response, reverse('posts:profile',
-                                               args=[self.user.username]))
-        self.assertEqual(Post.objects.count(), post_count + 1)
-        last_post = Post.objects.first()
+        last_post = Post.objects.get(id__gt=prev_max_id)
         image_name = form_data['image'].name
         self.assertEqual(last_post.author, self.user)
         self.assertEqual(last_post.text, form_data['text'])
@@ -81,29 +67,30 @@ class PostCreateFormTests(TestCase):
     def test_edit_post(self):
         form_data = {'text': 'Новый текст', 'group': self.group.id}
         response = self.authorized_client.post(
-            reverse('posts:post_edit', args=[
-                    self.post.id]),
-            data=form_data,
-            follow=True
+            self.url_edit,
+            data=form_data
         )
-        self.assertRedirects(response, reverse(
-            'posts:post_detail', args=[self.post.id]))
-        self.assertEqual(Post.objects.filter(
-            id=self.post.id).last().text, form_data['text'])
+        self.assertRedirects(
+            response,
+            self.url_detail,
+            fetch_redirect_response=False
+        )
+        self.assertEqual(
+            Post.objects.get(id=self.post.id).text, form_data['text'])
 
     def test_add_comment(self):
-        comment_count = Comment.objects.count()
+        prev_max_id = Comment.objects.aggregate(m=Max('id'))['m'] or 0
         form_data = {'text': 'Новый коммент'}
         response = self.authorized_client.post(
-            reverse('posts:add_comment', args=[
-                    self.post.id]),
-            data=form_data,
-            follow=True
+            self.url_comment,
+            data=form_data
+        )
+        self.assertRedirects(
+            response,
+            self.url_detail,
+            fetch_redirect_response=False
         )
-        self.assertRedirects(response, reverse(
-            'posts:post_detail', args=[self.post.id]))
-        self.assertEqual(Comment.objects.count(), comment_count + 1)
-        last_comment = Comment.objects.first()
+        last_comment = Comment.objects.get(id__gt=prev_max_id)
         self.assertEqual(last_comment.text, form_data['text'])
         self.assertEqual(last_comment.author, self.user)
         self.assertEqual(last_comment.post, self.post)
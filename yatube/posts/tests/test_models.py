@@ -8,8 +8,7 @@ User = get_user_model()
 
 class PostModelTest(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='auth')
         cls.post = Post.objects.create(
             author=cls.user,
@@ -25,8 +24,7 @@ class PostModelTest(TestCase):
 
 class GroupModelTest(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.group = Group.objects.create(
             title='Тестовая группа',
             slug='Тестовый слаг',
@@ -8,8 +8,7 @@ User = get_user_model()
 
 class StaticURLTests(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='Evgeny')
         cls.group = Group.objects.create(
             slug='test-slug',
@@ -21,24 +20,27 @@ class StaticURLTests(TestCase):
             text='Тестовая группа',
             group=cls.group,
         )
-
-    def setUp(self):
-        self.guest_client = Client()
-        self.user_authorized = User.objects.create_user(username='HasNoName')
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user_authorized)
+        cls.guest_client = Client()
+        cls.user_authorized = User.objects.create_user(username='HasNoName')
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user_authorized)
+        cls.url_index = reverse('posts:index')
+        cls.url_group = reverse('posts:list_group', args=[cls.group.slug])
+        cls.url_profile = reverse('posts:profile', args=[cls.user.username])
+        cls.url_detail = reverse('posts:post_detail', args=[cls.post.id])
+        cls.url_create = reverse('posts:post_create')
+        cls.url_edit = reverse('posts:post_edit', args=[cls.post.id])
+        cls.url_comment = reverse('posts:add_comment', args=[cls.post.id])
+        cls.url_login = reverse('users:login')
 
     def test_urls_uses_correct_template(self):
         """URL-адрес использует соответствующий шаблон."""
         templates_url_names = {
-            reverse('posts:index'): 'posts/index.html',
-            reverse('posts:list_group', args=[self.group.slug]):
-            'posts/group_list.html',
-            reverse('posts:profile', args=[self.user.username]):
-            'posts/profile.html',
-            reverse('posts:post_detail', args=[self.post.id]):
-            'posts/post_detail.html',
-            reverse('posts:post_create'): 'posts/create_post.html',
+            self.url_index: 'posts/index.html',
+            self.url_group: 'posts/group_list.html',
+            self.url_profile: 'posts/profile.html',
+            self.url_detail: 'posts/post_detail.html',
+            self.url_create: 'posts/create_post.html',
         }
         for adress, template in templates_url_names.items():
             with self.subTest(adress=adress):
@@ -47,26 +49,22 @@ class StaticURLTests(TestCase):
 
     def test_create_url_redirect_anonymous_on_admin_login(self):
         """Страница по адресу /create/ перенаправит анонимного
-        пользователя на страницу регистрации.
+        пользователя на страницу логина.
         """
-        adress = reverse('posts:post_create')
-        response = self.client.get(adress)
+        response = self.client.get(self.url_create)
         self.assertRedirects(
-            response, reverse('users:singup'))
+            response, f'{self.url_login}?next={self.url_create}')
 
-    def test_create_url_redirect_anonymous_on_admin_login(self):
+    def test_edit_url_redirect_not_author_on_post_detail(self):
         """Страница по адресу posts/<int:post_id>/edit/ перенаправит не автора
         на страницу с постом.
         """
-        adress = reverse('posts:post_edit', args=[self.post.id])
-        response = self.authorized_client.get(adress)
-        self.assertRedirects(
-            response, reverse('posts:post_detail', args=[self.post.id]))
+        response = self.authorized_client.get(self.url_edit)
+        self.assertRedirects(response, self.url_detail)
 
     def test_comment_url_redirect_anonymous_on_admin_login(self):
         """Страница по адресу /posts/<int:post_id>/comment перенаправит анонимного
         пользователя на страницу логина.
         """
-        adress = reverse('posts:add_comment', args=[self.post.id])
-        response = self.client.get(adress)
+        response = self.client.get(self.url_comment)
         self.assertEqual(response.status_code, 302)
@@ -1,39 +1,25 @@
-import shutil
-import tempfile
 from django.contrib.auth import get_user_model
-from django.conf import settings
-from django.test import Client, TestCase, override_settings
+from django.test import Client, RequestFactory, TestCase
+from django.test.signals import template_rendered
 from django.urls import reverse
 from django import forms
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.base import ContentFile
+from django.db.models import Max
 from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
 
+from posts import views
 from posts.models import Post, Group, Follow
+from posts.tests import SMALL_GIF, TempMediaRootMixin
 
 User = get_user_model()
 
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
 
-
-@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
-class PostPagesTests(TestCase):
+class PostPagesTests(TempMediaRootMixin, TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='Evgeny')
-        small_gif = (
-            b'\x47\x49\x46\x38\x39\x61\x02\x00'
-            b'\x01\x00\x80\x00\x00\x00\x00\x00'
-            b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
-            b'\x00\x00\x00\x2C\x00\x00\x00\x00'
-            b'\x02\x00\x01\x00\x00\x02\x02\x0C'
-            b'\x0A\x00\x3B'
-        )
-        cls.uploaded = SimpleUploadedFile(
-            name='small.gif',
-            content=small_gif,
-            content_type='image/gif'
-        )
+        cls.image = ContentFile(SMALL_GIF, name='small.gif')
         cls.group = Group.objects.create(
             slug='test-slug',
             title='Тестовая группа',
@@ -43,94 +29,90 @@ class PostPagesTests(TestCase):
             author=cls.user,
             text='Тестовый текст',
             group=cls.group,
-            image=cls.uploaded,
+            image=cls.image,
         )
+        cls.guest_client = Client()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
+        cls.author = Client()
+        cls.author.force_login(cls.post.author)
+        cls.factory = RequestFactory()
+        cls.url_index = reverse('posts:index')
+        cls.url_group = reverse('posts:list_group', args=[cls.group.slug])
+        cls.url_profile = reverse('posts:profile', args=[cls.user.username])
+        cls.url_detail = reverse('posts:post_detail', args=[cls.post.id])
+        cls.url_create = reverse('posts:post_create')
+        cls.url_edit = reverse('posts:post_edit', args=[cls.post.id])
 
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
+    def view_context(self, view, url, **kwargs):
+        """Вызывает view напрямую и возвращает контекст его шаблона."""
+        request = self.factory.get(url)
+        request.user = self.user
+        contexts = []
 
-    def setUp(self):
-        self.guest_client = Client()
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
-        self.user_author = PostPagesTests.post.author
-        self.author = Client()
-        self.author.force_login(self.user_author)
+        def store_context(sender, context, **kwargs):
+            contexts.append(context)
 
-    def test_pages_uses_correct_template(self):
-        """URL-адрес использует соответствующий шаблон."""
-        cache.clear()
-        templates_pages_names = {
-            reverse('posts:index'): 'posts/index.html',
-            reverse('posts:list_group', args=[self.group.slug]):
-            'posts/group_list.html',
-            reverse('posts:profile', args=[self.user.username]):
-            'posts/profile.html',
-            reverse('posts:post_detail', args=[self.post.id]):
-            'posts/post_detail.html',
-            reverse('posts:post_create'): 'posts/create_post.html',
-        }
-        for reverse_name, template in templates_pages_names.items():
-            with self.subTest(reverse_name=reverse_name):
-                response = self.authorized_client.get(reverse_name)
-                self.assertTemplateUsed(response, template)
+        template_rendered.connect(store_context)
+        try:
+            view(request, **kwargs)
+        finally:
+            template_rendered.disconnect(store_context)
+        return contexts[0]
 
     def post_context(self, test_post):
         self.assertEqual(test_post.text, self.post.text)
         self.assertEqual(test_post.author, self.user)
         self.assertEqual(test_post.group, self.group)
         self.assertTrue(
-            test_post.image.name.endswith(self.uploaded.name)
+            test_post.image.name.endswith(self.image.name)
         )
 
     def test_index_pages_show_correct_context(self):
         """Шаблон index сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse('posts:index'))
-        context_page = response.context['page_obj'][0]
+        context = self.view_context(views.index, self.url_index)
+        context_page = context['page_obj'][0]
         self.post_context(context_page)
 
     def test_list_group_pages_show_correct_context(self):
         """Шаблон list_group сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse('posts:list_group',
-                                              args=[self.group.slug]))
-        context_page = response.context['page_obj'][0]
+        context = self.view_context(views.group_posts, self.url_group,
+                                    slug=self.group.slug)
+        context_page = context['page_obj'][0]
         self.post_context(context_page)
-        context_group = response.context['group']
+        context_group = context['group']
         self.assertEqual(context_group, self.group)
 
-    def test_list_group_pages_show_correct_context(self):
+    def test_post_not_in_other_group(self):
         """В группе нет поста"""
         Group.objects.create(
             slug='test-slug-two',
             title='Вторая тестовая группа',
             description='Второе тестовое описание'
         )
-        response = self.authorized_client.get(reverse('posts:list_group',
-                                              args=[self.group.slug]))
-        self.assertEqual(len(response.context['page_obj']), 1)
+        context = self.view_context(views.group_posts, self.url_group,
+                                    slug=self.group.slug)
+        self.assertEqual(len(context['page_obj']), 1)
 
     def test_profile_pages_show_correct_context(self):
         """Шаблон profile сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse('posts:profile',
-                                              args=[self.user.username]))
-        context_page = response.context['page_obj'][0]
+        context = self.view_context(views.profile, self.url_profile,
+                                    username=self.user.username)
+        context_page = context['page_obj'][0]
         self.post_context(context_page)
-        context_author = response.context['author']
+        context_author = context['author']
         self.assertEqual(context_author, self.user)
 
     def test_post_detail_pages_show_correct_context(self):
         """Шаблон post_detail сформирован с правильным контекстом."""
-        response = (self.authorized_client.
-                    get(reverse('posts:post_detail',
-                        args=[self.post.id])))
-        context_page = response.context['post']
+        context = self.view_context(views.post_detail, self.url_detail,
+                                    post_id=self.post.id)
+        context_page = context['post']
         self.post_context(context_page)
 
     def test_create_post_pages_show_correct_context(self):
         """Шаблон post_create сформирован с правильным контекстом."""
-        response = self.authorized_client.get(reverse('posts:post_create'))
+        response = self.authorized_client.get(self.url_create)
         form_fields = {
             'text': forms.fields.CharField,
             'group': forms.fields.ChoiceField,
@@ -143,8 +125,7 @@ class PostPagesTests(TestCase):
 
     def test_post_edit_pages_show_correct_context(self):
         """Шаблон post_edit сформирован с правильным контекстом."""
-        response = self.author.get(reverse('posts:post_edit',
-                                           args=[self.post.id]))
+        response = self.author.get(self.url_edit)
         form_fields = {
             'text': forms.fields.CharField,
             'group': forms.fields.ChoiceField,
@@ -162,54 +143,60 @@ class PostPagesTests(TestCase):
             text='Новый текст',
             group=self.group
         )
-        response = self.guest_client.get(reverse('posts:index'))
-        content = response.content
+        cache.clear()
+        self.guest_client.get(self.url_index)
+        # posts/index.html: {% cache 20 index_page page_obj.number %}
+        key = make_template_fragment_key('index_page', [1])
+        self.assertIn(post.text, cache.get(key))
         post.delete()
-        response = self.guest_client.get(reverse('posts:index'))
-        content_cached = response.content
-        self.assertEqual(content, content_cached)
+        response = self.guest_client.get(self.url_index)
+        self.assertIn(post.text, response.content.decode())
         cache.clear()
-        response = self.guest_client.get(reverse('posts:index'))
-        content = response.content
-        self.assertNotEqual(content, content_cached)
+        self.assertIsNone(cache.get(key))
 
 
 class PaginatorViewsTest(TestCase):
 
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='Evgeny')
         cls.group = Group.objects.create(
             slug='test-slug',
             title='Заголовок',
             description='Тестовое описание'
         )
-        for i in range(13):
-            Post.objects.create(
+        Post.objects.bulk_create([
+            Post(
                 author=cls.user,
                 text='Тестовый текст',
                 group=cls.group,
             )
+            for _ in range(13)
+        ])
+        cls.url_index = reverse('posts:index')
+        cls.url_group = reverse('posts:list_group', args=[cls.group.slug])
+        cls.url_profile = reverse('posts:profile', args=[cls.user.username])
 
     def test_first_page_contains_ten_records(self):
         """Проверка количество постов на первой странице равно 10"""
-        ten_records = [
-            reverse('posts:index'),
-            reverse('posts:list_group', args=[self.group.slug]),
-            reverse('posts:profile', args=[self.user.username])
-        ]
-        for reverse_name in ten_records:
+        cache.clear()
+        ten_records = {
+            self.url_index: 2,
+            self.url_group: 3,
+            self.url_profile: 4,
+        }
+        for reverse_name, num_queries in ten_records.items():
             with self.subTest(reverse_name=reverse_name):
-                response = self.client.get(reverse_name)
+                with self.assertNumQueries(num_queries):
+                    response = self.client.get(reverse_name)
                 self.assertEqual(len(response.context['page_obj']), 10)
 
     def test_second_page_contains_three_records(self):
         """Проверка количество постов на первой странице равно 3"""
         three_records = [
-            reverse('posts:index'),
-            reverse('posts:list_group', args=[self.group.slug]),
-            reverse('posts:profile', args=[self.user.username])
+            self.url_index,
+            self.url_group,
+            self.url_profile,
         ]
         for reverse_name in three_records:
             with self.subTest(reverse_name=reverse_name):
@@ -218,58 +205,62 @@ class PaginatorViewsTest(TestCase):
 
 
 class FollowViewsTest(TestCase):
-
-    def setUp(self):
-        self.follower = User.objects.create_user(username='follower')
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.follower)
-        self.author = User.objects.create_user(username='author')
-        self.post_author = Post.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.follower = User.objects.create_user(username='follower')
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.follower)
+        cls.author = User.objects.create_user(username='author')
+        cls.post_author = Post.objects.create(
             text='Тестовый текст',
-            author=self.author
+            author=cls.author
         )
+        cls.url_profile = reverse('posts:profile', args=[cls.author])
+        cls.url_follow = reverse('posts:profile_follow', args=[cls.author])
+        cls.url_unfollow = reverse(
+            'posts:profile_unfollow', args=[cls.author])
+        cls.url_follow_index = reverse('posts:follow_index')
 
     def test_subscription(self):
         """Тест подписки"""
-        follow_count = Follow.objects.count()
-        response = self.authorized_client.get(
-            reverse('posts:profile_follow', args=[self.author])
-        )
-        self.assertEqual(Follow.objects.count(), follow_count + 1)
-        last_follow = Follow.objects.first()
+        prev_max_id = Follow.objects.aggregate(m=Max('id'))['m'] or 0
+        response = self.authorized_client.get(self.url_follow)
+        last_follow = Follow.objects.get(id__gt=prev_max_id)
         self.assertEqual(last_follow.author, self.author)
         self.assertEqual(last_follow.user, self.follower)
-        self.assertRedirects(response, reverse(
-            'posts:profile', args=[self.author]))
+        self.assertRedirects(
+            response,
+            self.url_profile,
+            fetch_redirect_response=False
+        )
 
     def test_unsubscribe(self):
         """Тест отписки"""
-        follow_count = Follow.objects.count()
-        self.authorized_client.get(
-            reverse('posts:profile_follow', args=[self.author]))
-        response = self.authorized_client.get(
-            reverse('posts:profile_unfollow', args=[self.author]))
-        self.assertEqual(Follow.objects.count(), follow_count)
-        self.assertRedirects(response, reverse(
-            'posts:profile', args=[self.author]))
+        self.authorized_client.get(self.url_follow)
+        response = self.authorized_client.get(self.url_unfollow)
+        self.assertFalse(Follow.objects.filter(
+            user=self.follower, author=self.author).exists())
+        self.assertRedirects(
+            response,
+            self.url_profile,
+            fetch_redirect_response=False
+        )
 
     def test_presence_of_a_post(self):
         """Проверка наличия поста"""
-        self.authorized_client.get(
-            reverse('posts:profile_follow', args=[self.author]))
-        response = self.authorized_client.get(
-            reverse('posts:follow_index'))
+        self.authorized_client.get(self.url_follow)
+        response = self.authorized_client.get(self.url_follow_index)
         context_page = response.context['page_obj'][0]
         self.assertEqual(context_page, self.post_author)
 
     def test_no_post(self):
         """Проверка отстуствие поста"""
         new_author = User.objects.create_user(username='new_author')
-        self.authorized_client.force_login(new_author)
+        new_author_client = Client()
+        new_author_client.force_login(new_author)
         Post.objects.create(
             text='Новый тестовый текст',
             author=new_author,
         )
-        response = self.authorized_client.get(
-            reverse('posts:follow_index'))
+        response = new_author_client.get(self.url_follow_index)
         self.assertEqual(len(response.context['page_obj']), 0)
@@ -89,6 +89,9 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        # Guard only: Django already runs SQLite tests in memory; this keeps
+        # a future TEST NAME override from moving them onto disk.
+        'TEST': {'NAME': ':memory:'},
     }
 }
 